@@ -0,0 +1,11 @@
+"""
+Backend package for smart search.
+"""
+
+def __getattr__(name):
+    # Resolve check_database_lock lazily so importing the package stays cheap
+    if name == "check_database_lock":
+        from backend.chroma_client import check_database_lock
+        globals()[name] = check_database_lock
+        return check_database_lock
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
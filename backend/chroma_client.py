@@ -45,6 +45,9 @@ except (ImportError, AttributeError):
 
 logger = get_chroma_logger()
 
+# Low-cardinality metadata fields whose values repeat across most results
+INTERNED_METADATA_KEYS = ('repo_name', 'language', 'chunk_type', 'file_type', 'type')
+
 class ChromaClient:
     _instance = None
     _client = None
@@ -203,6 +206,24 @@ class ChromaClient:
             raise RuntimeError("ChromaDB client not initialized")
         return self._client.get_collection(name)
     
+    @staticmethod
+    def intern_metadata(metadata: Any) -> Any:
+        """
+        Intern repeated metadata values in place so duplicate strings share one object.
+        
+        Args:
+            metadata: Metadata dictionary from ChromaDB
+            
+        Returns:
+            The same metadata dictionary
+        """
+        if metadata:
+            for key in INTERNED_METADATA_KEYS:
+                value = metadata.get(key)
+                if isinstance(value, str):
+                    metadata[key] = sys.intern(value)
+        return metadata
+    
     @staticmethod
     def format_repository_info(metadata: Any, document: Optional[str] = None, include_path: bool = True) -> Dict[str, Any]:
         """
@@ -260,6 +281,9 @@ class ChromaClient:
                 file_info['content_preview'] = document[:preview_length] + "..."
             else:
                 file_info['content_preview'] = document
+        elif 'preview' in metadata:
+            # Precomputed at index time for metadata-only queries
+            file_info['content_preview'] = metadata['preview']
                 
         return file_info
     
@@ -309,7 +333,7 @@ class ChromaClient:
             return repos
             
         for i, doc in enumerate(results['documents']):
-            metadata = results['metadatas'][i]
+            metadata = ChromaClient.intern_metadata(results['metadatas'][i])
             repo_info = ChromaClient.format_repository_info(metadata, include_path=True)
             
             if include_description:
@@ -335,12 +359,19 @@ class ChromaClient:
             List of formatted file information
         """
         files = []
-        if not results.get('documents'):
+        if not results.get('metadatas'):
             return files
-            
-        for i, doc in enumerate(results['documents']):
-            metadata = results['metadatas'][i]
+        
+        # Documents are absent when the query only included metadatas
+        documents = results.get('documents')
+        for i, metadata in enumerate(results['metadatas']):
+            metadata = ChromaClient.intern_metadata(metadata)
+            doc = documents[i] if documents else None
             file_info = ChromaClient.format_file_info(metadata, doc, preview_length)
             files.append(file_info)
             
         return files
+
+def get_client(db_path: Optional[str] = None) -> ChromaClient:
+    """Get the process-wide ChromaDB client, opening the database only on first use"""
+    return ChromaClient._instance or ChromaClient(db_path)
@@ -9,16 +9,73 @@ import os
 import sys
 import logging
 import hashlib
+import mmap
+import codecs
+import itertools
+import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple, Iterator, Iterable
 import json
+import math
+import re
 from datetime import datetime
 from backend.logger import get_logger
 from backend.chroma_client import ChromaClient
 from backend.config import config
 
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 logger = get_logger()
 
+# Files at or above this size are hashed through a memory map instead of a read
+HASH_MMAP_THRESHOLD = 64 * 1024
+
+# Buffer size used when reading source files, and how much of the head is sniffed for binaries
+READ_BUFFER_SIZE = 1 << 20
+BINARY_SNIFF_SIZE = 8192
+
+# Line patterns marking semantic boundaries (functions, classes) for different languages
+SEMANTIC_MARKERS = {
+    'Python': [r'^\s*def\s+', r'^\s*class\s+', r'^\s*@\w+', r'^\s*if\s+__name__'],
+    'JavaScript': [r'^\s*function\s+', r'^\s*class\s+', r'^\s*const\s+\w+\s*=\s*\(', r'^\s*export\s+'],
+    'TypeScript': [r'^\s*function\s+', r'^\s*class\s+', r'^\s*interface\s+', r'^\s*type\s+'],
+    'Java': [r'^\s*public\s+class\s+', r'^\s*private\s+\w+', r'^\s*public\s+\w+', r'^\s*@\w+'],
+    'C++': [r'^\s*class\s+', r'^\s*struct\s+', r'^\s*\w+\s*::\s*', r'^\s*template\s*<'],
+    'C': [r'^\s*\w+\s+\w+\s*\(', r'^\s*struct\s+', r'^\s*typedef\s+', r'^\s*#define\s+']
+}
+
+# Number of documents whose semantic boundary lines are remembered, keyed by content hash
+BOUNDARY_CACHE_SIZE = 256
+
+# Characters of chunk content remembered, so identical content is only chunked once
+CHUNK_CACHE_MAX_CHARS = 4 * 1024 * 1024
+
+# Documents shorter than this, or only whitespace, are not chunked
+MIN_CHUNK_CHARS = 16
+
+# Default cap on overlap as a fraction of chunk_size when overlap is fitted to a document's length
+MAX_REPETITION_RATIO = 0.2
+
+# Uncached documents are chunked in worker processes once a call has at least this many;
+# spawning workers costs about a second, so small batches stay in-process
+PARALLEL_CHUNK_MIN_DOCS = 32
+
+# Chunking-only indexer of a worker process, created on first use
+_worker_chunker = None
+
+def _chunk_one(doc: Dict, chunk_size: int, chunk_overlap: int, r_max: float) -> List[Dict]:
+    """Chunk one document in a worker process, without opening a ChromaDB client"""
+    global _worker_chunker
+    if _worker_chunker is None:
+        _worker_chunker = ChromaIndexer.__new__(ChromaIndexer)
+        _worker_chunker._init_chunk_caches()
+    return _worker_chunker._chunk_document(doc, chunk_size, chunk_overlap, r_max)
+
 class ChromaIndexer:
     def __init__(self, db_path: Optional[str] = None):
         # Use config for default path if not provided
@@ -38,30 +95,54 @@ class ChromaIndexer:
             name="chunks",
             metadata={"hnsw:space": "cosine"}
         )
+        
+        self._init_chunk_caches()
+    
+    def _init_chunk_caches(self):
+        """Set up the per-indexer caches used while chunking"""
+        # Compiled boundary pattern per language, built on first use
+        self._marker_cache: Dict[str, Optional[re.Pattern]] = {}
+        
+        # Semantic boundary line numbers per (content hash, language), most recently used last
+        self._boundary_cache: OrderedDict = OrderedDict()
+        
+        # Chunks per (content hash, language, chunk size, overlap), most recently used last,
+        # holding at most CHUNK_CACHE_MAX_CHARS characters of chunk content
+        self._chunk_cache: OrderedDict = OrderedDict()
+        self._chunk_cache_chars = 0
     
-    def index_repository(self, repo_path: str, repo_name: Optional[str] = None):
-        """Index a single repository"""
+    def index_repository(self, repo_path: str, repo_name: Optional[str] = None, raw_docs: Optional[List[Dict]] = None):
+        """Index a single repository, optionally using files already read by load_repository_files()"""
         repo_path_obj = Path(repo_path)
         if not repo_name:
             repo_name = repo_path_obj.name
         
         # Index individual files and chunks
-        self._index_files_and_chunks(repo_path_obj, repo_name)
+        self._index_files_and_chunks(repo_path_obj, repo_name, raw_docs)
     
-    def _index_files_and_chunks(self, repo_path: Path, repo_name: str):
-        """Index individual files and their chunks with progress tracking"""
-        # Use configuration from config.json
-        indexer_config = {
+    def load_repository_files(self, repo_path: str) -> List[Dict]:
+        """Read a repository's supported files without touching the database"""
+        repo_path_obj = Path(repo_path)
+        return self._load_files(repo_path_obj, self._get_indexer_config(repo_path_obj))
+    
+    def _get_indexer_config(self, repo_path: Path) -> Dict:
+        """Use configuration from config.json"""
+        return {
             'source_folder': str(repo_path),
             'supported_extensions': config.supported_extensions,
             'chunk_size': config.chunk_size,
             'chunk_overlap': config.chunk_overlap,
             'ignore_patterns': config.ignore_patterns
         }
+    
+    def _index_files_and_chunks(self, repo_path: Path, repo_name: str, raw_docs: Optional[List[Dict]] = None):
+        """Index individual files and their chunks with progress tracking"""
+        indexer_config = self._get_indexer_config(repo_path)
         
         try:
-            # Load files directly
-            raw_docs = self._load_files(repo_path, indexer_config)
+            # Load files directly unless they were read ahead of time
+            if raw_docs is None:
+                raw_docs = self._load_files(repo_path, indexer_config)
             if not raw_docs:
                 logger.warning(f"No files found in {repo_path}")
                 return
@@ -87,15 +168,18 @@ class ChromaIndexer:
                 changed_files, unchanged_files = self._index_files_with_progress(raw_docs, repo_name)
 
                 # Only process chunks for changed files
+                changed_chunk_count = 0
                 if changed_files:
+                    # Stream chunks into ChromaDB; progress is scaled to an estimate from the file sizes
+                    chunk_size = indexer_config.get('chunk_size', config.chunk_size)
+                    expected = sum(len(doc['content']) // chunk_size + 1 for doc in changed_files)
                     changed_chunks = self._chunk_documents(changed_files, indexer_config)
-                    self._index_chunks_with_progress(changed_chunks, repo_name, changed_files)
+                    changed_chunk_count = self._index_chunks_with_progress(changed_chunks, repo_name, changed_files, expected)
                 else:
                     print("Chunks: [=] (no changes to process)")
                 
-                # Show final summary
-                total_chunks = len(self._chunk_documents(raw_docs, indexer_config)) if raw_docs else 0
-                changed_chunk_count = len(self._chunk_documents(changed_files, indexer_config)) if changed_files else 0
+                # Show final summary; only unchanged files still need counting, without holding their chunks
+                total_chunks = changed_chunk_count + sum(1 for _ in self._chunk_documents(unchanged_files, indexer_config))
                 print(f"Summary: {len(raw_docs)} files ({len(changed_files)} changed) → {total_chunks} chunks ({changed_chunk_count} processed)")
             finally:
                 # Restore all logging and output
@@ -140,15 +224,16 @@ class ChromaIndexer:
                 file_id = f"file_{repo_name}_{relative_path}".replace("/", "_").replace("\\", "_").replace(".", "_")
                 new_file_ids.add(file_id)
                 
-                # Get current file path for metadata comparison
-                current_file_path = Path(doc['filename'])
+                # Get current file path for metadata comparison, reusing the stat from the walk
+                current_file_path = Path(doc.get('full_path', doc['filename']))
+                file_metadata = self._get_file_metadata(current_file_path, doc.get('stat'))
                 
                 # Determine operation type and track changes
                 is_changed = False
                 if file_id in existing_file_ids:
                     # Use improved change detection
                     existing_metadata = existing_files_metadata.get(file_id, {})
-                    if self._has_file_changed(current_file_path, existing_metadata):
+                    if self._has_file_changed(current_file_path, existing_metadata, file_metadata):
                         modified += 1
                         symbol = "*"  # Modified
                         is_changed = True
@@ -172,9 +257,6 @@ class ChromaIndexer:
                 # Truncate content for file-level indexing
                 file_content = content[:5000] + "..." if len(content) > 5000 else content
                 
-                # Get file metadata for storage
-                file_metadata = self._get_file_metadata(current_file_path)
-                
                 documents.append(file_content)
                 metadatas.append({
                     'repo_name': repo_name,
@@ -185,13 +267,15 @@ class ChromaIndexer:
                     'size': file_metadata['size'],
                     'mtime': file_metadata['mtime'],
                     'hash': file_metadata['hash'],
+                    'preview': content[:200] + "..." if len(content) > 200 else content,
                     'type': 'file'
                 })
                 ids.append(file_id)
                 
             except Exception as e:
                 print("!", end="", flush=True)  # Error symbol
-                logger.error(f"Error processing file {doc.get('filename', 'unknown')}: {e}")
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(f"Error processing file {doc.get('filename', 'unknown')}: {e}")
                 continue
         
         # Find deleted files
@@ -213,11 +297,7 @@ class ChromaIndexer:
                     logger.debug(f"No existing files to delete for {repo_name}: {e}")
                 
                 # Add new files
-                self.files_collection.add(
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids
-                )
+                self._add_in_batches(self.files_collection, documents, metadatas, ids)
                 print(f"({len(documents)} files: +{added} *{modified} ={unchanged} -{len(deleted_files)})")
             except Exception as e:
                 logger.error(f"Error adding files to collection: {e}")
@@ -266,12 +346,14 @@ class ChromaIndexer:
                     'language': self._detect_language(Path(doc['filename']).suffix),
                     'file_type': doc.get('file_type', 'unknown'),
                     'size': len(content),
+                    'preview': content[:200] + "..." if len(content) > 200 else content,
                     'type': 'file'
                 })
                 ids.append(file_id)
                 
             except Exception as e:
-                logger.error(f"Error processing file {doc.get('filename', 'unknown')}: {e}")
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(f"Error processing file {doc.get('filename', 'unknown')}: {e}")
                 continue
         
         if documents:
@@ -285,45 +367,35 @@ class ChromaIndexer:
                     logger.debug(f"No existing files to delete for {repo_name}: {e}")
                 
                 # Add new files
-                self.files_collection.add(
-                    documents=documents,
-                    metadatas=metadatas,
-                    ids=ids
-                )
+                self._add_in_batches(self.files_collection, documents, metadatas, ids)
                 logger.info(f"✅ Indexed {len(documents)} files")
             except Exception as e:
                 logger.error(f"Error adding files to collection: {e}")
     
-    def _index_chunks_with_progress(self, chunks: List[Dict], repo_name: str, changed_files: Optional[List[Dict]] = None):
-        """Index document chunks with progress tracking, only for changed files"""
-        if not chunks:
+    def _index_chunks_with_progress(self, chunks: Iterable[Dict], repo_name: str,
+                                    changed_files: Optional[List[Dict]] = None, expected: int = 0) -> int:
+        """
+        Index document chunks with progress tracking, only for changed files.
+        
+        Chunks are consumed as they are produced and added to ChromaDB a batch at a time;
+        expected is an estimate of their number used to scale the progress output.
+        Returns the number of chunks processed.
+        """
+        chunks = iter(chunks)
+        first = next(chunks, None)
+        if first is None:
+            # Changed files that no longer produce any chunks still lose their old ones
+            if changed_files:
+                self._delete_changed_file_chunks(repo_name, changed_files)
             print("Chunks: [=] (no chunks to process)")
-            return
+            return 0
             
         # Get existing chunks for this repo
         existing_chunks = self._get_existing_chunk_ids(repo_name)
         
         # If we have changed_files list, only delete chunks for those files
         if changed_files:
-            changed_file_paths = {doc.get('relative_path', doc['filename']) for doc in changed_files}
-            chunks_to_delete = []
-            
-            # Get all existing chunks and filter by changed files
-            try:
-                existing_chunk_results = self.chunks_collection.get(where={"repo_name": repo_name})
-                if existing_chunk_results and existing_chunk_results.get('ids'):
-                    metadatas = existing_chunk_results.get('metadatas')
-                    for i, chunk_id in enumerate(existing_chunk_results['ids']):
-                        if metadatas and i < len(metadatas):
-                            metadata = metadatas[i]
-                            file_path = metadata.get('file_path', '')
-                            if file_path in changed_file_paths:
-                                chunks_to_delete.append(chunk_id)
-                    
-                    if chunks_to_delete:
-                        self.chunks_collection.delete(ids=chunks_to_delete)
-            except Exception as e:
-                logger.debug(f"No existing chunks to delete for changed files: {e}")
+            self._delete_changed_file_chunks(repo_name, changed_files)
         else:
             # Delete all chunks for this repo (fallback behavior)
             try:
@@ -341,13 +413,18 @@ class ChromaIndexer:
         
         # Progress tracking
         added = modified = unchanged = 0
+        processed = indexed = 0
+        add_failed = False
+        symbol = None
+        printed = -1
         
         # Show progress header
         print(f"Chunks: [", end="", flush=True)
         
         # Process chunks in groups to avoid overwhelming the console
-        group_size = max(1, len(chunks) // 50)  # Show up to 50 symbols max
-        for i, chunk in enumerate(chunks):
+        group_size = max(1, expected // 50)  # Show up to 50 symbols max
+        for i, chunk in enumerate(itertools.chain((first,), chunks)):
+            processed += 1
             try:
                 relative_path = chunk.get('relative_path', chunk['filename'])
                 chunk_id = f"chunk_{repo_name}_{relative_path}_{chunk.get('chunk_index', 0)}".replace("/", "_").replace("\\", "_").replace(".", "_")
@@ -362,8 +439,9 @@ class ChromaIndexer:
                     symbol = "+"  # Added
                 
                 # Only show symbol every group_size chunks
-                if i % group_size == 0 or i == len(chunks) - 1:
+                if i % group_size == 0:
                     print(symbol, end="", flush=True)
+                    printed = i
                 
                 documents.append(chunk['content'])
                 metadatas.append({
@@ -380,8 +458,19 @@ class ChromaIndexer:
                 
             except Exception as e:
                 print("!", end="", flush=True)  # Error symbol
-                logger.error(f"Error processing chunk: {e}")
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(f"Error processing chunk: {e}")
                 continue
+            
+            # Add full batches as they fill so only one batch of chunks is held at a time
+            if len(documents) >= config.batch_size:
+                add_failed |= not self._flush_chunks(documents, metadatas, ids)
+                indexed += len(documents)
+                documents, metadatas, ids = [], [], []
+        
+        # Always show the symbol for the last chunk
+        if symbol and printed != processed - 1:
+            print(symbol, end="", flush=True)
         
         # Find deleted chunks
         deleted_chunks = existing_chunks - new_chunk_ids
@@ -390,30 +479,49 @@ class ChromaIndexer:
         
         print("] ", end="", flush=True)
         
+        # Note: Chunk cleanup was already done above based on changed_files
         if documents:
-            try:
-                # Note: Chunk cleanup was already done above based on changed_files
-                # No need to delete all chunks again here
-                
-                # Add new chunks in batches
-                batch_size = config.batch_size
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i:i + batch_size]
-                    batch_metas = metadatas[i:i + batch_size]
-                    batch_ids = ids[i:i + batch_size]
-                    
-                    self.chunks_collection.add(
-                        documents=batch_docs,
-                        metadatas=batch_metas,
-                        ids=batch_ids
-                    )
-                
-                print(f"({len(documents)} chunks: +{added} *{modified} -{len(deleted_chunks)})")
-            except Exception as e:
-                logger.error(f"Error adding chunks to collection: {e}")
-        else:
+            add_failed |= not self._flush_chunks(documents, metadatas, ids)
+            indexed += len(documents)
+        
+        if not indexed:
             print("(no chunks to index)")
+        elif not add_failed:
+            print(f"({indexed} chunks: +{added} *{modified} -{len(deleted_chunks)})")
+        
+        return processed
+    
+    def _flush_chunks(self, documents: List[str], metadatas: List[Dict], ids: List[str]) -> bool:
+        """Add a batch of chunks to the collection, returning whether it succeeded"""
+        try:
+            self._add_in_batches(self.chunks_collection, documents, metadatas, ids)
+            return True
+        except Exception as e:
+            logger.error(f"Error adding chunks to collection: {e}")
+            return False
 
+    def _delete_changed_file_chunks(self, repo_name: str, changed_files: List[Dict]):
+        """Delete the existing chunks of the given changed files"""
+        changed_file_paths = {doc.get('relative_path', doc['filename']) for doc in changed_files}
+        chunks_to_delete = []
+        
+        # Get all existing chunks and filter by changed files
+        try:
+            existing_chunk_results = self.chunks_collection.get(where={"repo_name": repo_name})
+            if existing_chunk_results and existing_chunk_results.get('ids'):
+                metadatas = existing_chunk_results.get('metadatas')
+                for i, chunk_id in enumerate(existing_chunk_results['ids']):
+                    if metadatas and i < len(metadatas):
+                        metadata = metadatas[i]
+                        file_path = metadata.get('file_path', '')
+                        if file_path in changed_file_paths:
+                            chunks_to_delete.append(chunk_id)
+                
+                if chunks_to_delete:
+                    self.chunks_collection.delete(ids=chunks_to_delete)
+        except Exception as e:
+            logger.debug(f"No existing chunks to delete for changed files: {e}")
+    
     def _get_existing_file_ids(self, repo_name: str) -> Set[str]:
         """Get existing file IDs for a repository"""
         try:
@@ -455,7 +563,8 @@ class ChromaIndexer:
                 ids.append(chunk_id)
                 
             except Exception as e:
-                logger.error(f"Error processing chunk: {e}")
+                if logger.isEnabledFor(logging.ERROR):
+                    logger.error(f"Error processing chunk: {e}")
                 continue
         
         if documents:
@@ -469,22 +578,28 @@ class ChromaIndexer:
                     logger.debug(f"No existing chunks to delete for {repo_name}: {e}")
                 
                 # Add new chunks in batches
-                batch_size = config.batch_size
-                for i in range(0, len(documents), batch_size):
-                    batch_docs = documents[i:i + batch_size]
-                    batch_metas = metadatas[i:i + batch_size]
-                    batch_ids = ids[i:i + batch_size]
-                    
-                    self.chunks_collection.add(
-                        documents=batch_docs,
-                        metadatas=batch_metas,
-                        ids=batch_ids
-                    )
+                self._add_in_batches(self.chunks_collection, documents, metadatas, ids)
                 
                 logger.info(f"✅ Indexed {len(documents)} chunks")
             except Exception as e:
                 logger.error(f"Error adding chunks to collection: {e}")
     
+    def _add_in_batches(self, collection, documents: List[str], metadatas: List[Dict], ids: List[str]):
+        """Add documents to a collection in batches so each embedding call gets a full batch"""
+        batch_size = config.batch_size
+        try:
+            # Never exceed the largest batch the ChromaDB backend accepts in one call
+            batch_size = min(batch_size, self.chroma_client.client.get_max_batch_size())
+        except Exception:
+            pass
+        
+        for i in range(0, len(documents), batch_size):
+            collection.add(
+                documents=documents[i:i + batch_size],
+                metadatas=metadatas[i:i + batch_size],
+                ids=ids[i:i + batch_size]
+            )
+    
     def _is_supported_file(self, file_path: Path) -> bool:
         """Check if file is supported"""
         supported_extensions = set(config.supported_extensions)
@@ -557,10 +672,11 @@ class ChromaIndexer:
         supported_extensions = indexer_config.get('supported_extensions', config.supported_extensions)
         ignore_patterns = indexer_config.get('ignore_patterns', config.ignore_patterns)
         
-        for file_path in repo_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-                
+        max_file_size = indexer_config.get('max_file_size', config.max_file_size)
+        
+        for entry, stat in self._walk_files(repo_path):
+            file_path = Path(entry.path)
+            
             # Check if file should be ignored
             if self._should_ignore_file(file_path, ignore_patterns):
                 continue
@@ -568,11 +684,24 @@ class ChromaIndexer:
             # Check if file extension is supported
             if file_path.suffix.lower() not in supported_extensions:
                 continue
+            
+            # Skip oversized files before opening them
+            if max_file_size and stat.st_size > max_file_size:
+                logger.debug(f"Skipping large file {file_path} ({stat.st_size} bytes)")
+                continue
+                
+            language = self._detect_language(file_path.suffix)
                 
             try:
-                # Read file content
-                with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
+                # Read file content, probing the head of files with no known language for binary data
+                with open(file_path, 'rb', buffering=READ_BUFFER_SIZE) as f:
+                    head = f.read(BINARY_SNIFF_SIZE)
+                    if language == 'Unknown' and self._looks_binary(head):
+                        continue
+                    raw = head + f.read()
+                
+                # Decode and normalize newlines the same way text mode would
+                content = raw.decode('utf-8', errors='ignore').replace('\r\n', '\n').replace('\r', '\n')
                 
                 # Skip empty files
                 if not content.strip():
@@ -583,52 +712,162 @@ class ChromaIndexer:
                     'filename': str(file_path.relative_to(repo_path)),
                     'relative_path': str(file_path.relative_to(repo_path)),
                     'full_path': str(file_path),
-                    'language': self._detect_language(file_path.suffix),
+                    'language': language,
                     'file_type': 'text',
-                    'size': len(content)
+                    'size': len(content),
+                    'stat': stat
                 })
                 
             except Exception as e:
-                logger.warning(f"Error reading file {file_path}: {e}")
+                if logger.isEnabledFor(logging.WARNING):
+                    logger.warning(f"Error reading file {file_path}: {e}")
                 continue
         
         return documents
     
-    def _chunk_documents(self, documents: List[Dict], indexer_config: Dict) -> List[Dict]:
-        """Chunk documents into smaller pieces with proper overlap and metadata"""
-        chunks = []
+    @staticmethod
+    def _looks_binary(head: bytes) -> bool:
+        """Check if the first bytes of a file look like binary rather than UTF-8 text"""
+        if b'\x00' in head:
+            return True
+        try:
+            # Incremental decode tolerates a multi-byte sequence cut off at the end of the head
+            codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+            return False
+        except UnicodeDecodeError:
+            return True
+    
+    def _walk_files(self, root: Path) -> Iterator[Tuple[os.DirEntry, os.stat_result]]:
+        """Recursively yield (entry, stat) pairs for regular files using os.scandir"""
+        pending = [str(root)]
+        while pending:
+            try:
+                with os.scandir(pending.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file():
+                                yield entry, entry.stat()
+                        except OSError as e:
+                            logger.debug(f"Cannot stat {entry.path}: {e}")
+            except OSError as e:
+                logger.warning(f"Error scanning directory: {e}")
+    
+    def _chunk_documents(self, documents: List[Dict], indexer_config: Dict) -> Iterator[Dict]:
+        """Chunk documents into smaller pieces with proper overlap and metadata, yielding chunks in order"""
         chunk_size = indexer_config.get('chunk_size', config.chunk_size)
         chunk_overlap = indexer_config.get('chunk_overlap', config.chunk_overlap)
+        r_max = indexer_config.get('r_max', MAX_REPETITION_RATIO)
+        min_chars = indexer_config.get('min_chunk_chars', MIN_CHUNK_CHARS)
         
-        for doc in documents:
-            content = doc['content']
-            file_path = doc.get('relative_path', doc['filename'])
-            language = doc['language']
-            
-            # For small files, create a single chunk
-            if len(content) <= chunk_size:
-                chunks.append({
-                    'content': content,
-                    'filename': doc['filename'],
-                    'relative_path': file_path,
-                    'full_path': doc['full_path'],
-                    'language': language,
-                    'chunk_type': 'text',
-                    'chunk_index': 0,
-                    'start_pos': 0,
-                    'end_pos': len(content)
-                })
-                continue
-            
-            # Use code-aware chunking for programming languages
-            if self._is_code_file(language):
-                file_chunks = self._chunk_code_intelligently(content, doc, chunk_size, chunk_overlap)
-            else:
-                file_chunks = self._chunk_text_by_lines(content, doc, chunk_size, chunk_overlap)
-            
-            chunks.extend(file_chunks)
+        # Skip empty and trivial documents before any hashing or splitting
+        documents = [doc for doc in documents if len(doc['content']) >= min_chars and not doc['content'].isspace()]
         
-        return chunks
+        workers = min(os.cpu_count() or 1, len(documents))
+        if workers < 2 or len(documents) < PARALLEL_CHUNK_MIN_DOCS:
+            for doc in documents:
+                yield from self._chunk_document(doc, chunk_size, chunk_overlap, r_max)
+            return
+        
+        # Only documents that are neither single-chunk nor cached are worth sending to workers
+        keys = [self._chunk_key(doc, chunk_size, chunk_overlap, r_max) for doc in documents]
+        is_miss = [key is not None and key not in self._chunk_cache for key in keys]
+        misses = [doc for doc, miss in zip(documents, is_miss) if miss]
+        if len(misses) < PARALLEL_CHUNK_MIN_DOCS:
+            for doc, key in zip(documents, keys):
+                yield from self._chunk_document(doc, chunk_size, chunk_overlap, r_max, key)
+            return
+        
+        # Spawned workers start clean, so they never share this process's ChromaDB client;
+        # their results are merged into this indexer's cache as they come back in order
+        context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=min(workers, len(misses)), mp_context=context) as pool:
+            results = pool.map(
+                _chunk_one, misses, itertools.repeat(chunk_size), itertools.repeat(chunk_overlap),
+                itertools.repeat(r_max), chunksize=max(1, len(misses) // (workers * 4))
+            )
+            for doc, key, miss in zip(documents, keys, is_miss):
+                if miss:
+                    file_chunks = next(results)
+                    self._remember_chunks(key, file_chunks)
+                    yield from file_chunks
+                else:
+                    yield from self._chunk_document(doc, chunk_size, chunk_overlap, r_max, key)
+    
+    def _chunk_key(self, doc: Dict, chunk_size: int, chunk_overlap: int, r_max: float) -> Optional[Tuple]:
+        """Get the chunk cache key of a document, or None if it fits in a single chunk"""
+        content = doc['content']
+        if len(content) <= chunk_size:
+            return None
+        
+        # Use no more overlap than it takes to tile this document evenly
+        chunk_overlap = self._fit_overlap(len(content), chunk_size, chunk_overlap, r_max)
+        digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        return (digest, doc['language'], chunk_size, chunk_overlap)
+    
+    def _chunk_document(self, doc: Dict, chunk_size: int, chunk_overlap: int,
+                        r_max: float = MAX_REPETITION_RATIO, key: Optional[Tuple] = None) -> List[Dict]:
+        """Chunk a single document, reusing its cache key when the caller already computed it"""
+        content = doc['content']
+        file_path = doc.get('relative_path', doc['filename'])
+        language = doc['language']
+        
+        # For small files, create a single chunk
+        if len(content) <= chunk_size:
+            return [{
+                'content': content,
+                'filename': doc['filename'],
+                'relative_path': file_path,
+                'full_path': doc['full_path'],
+                'language': language,
+                'chunk_type': 'text',
+                'chunk_index': 0,
+                'start_pos': 0,
+                'end_pos': len(content)
+            }]
+        
+        # Identical content (vendored or copied files) reuses its chunks with this file's paths
+        if key is None:
+            key = self._chunk_key(doc, chunk_size, chunk_overlap, r_max)
+        digest, _, _, chunk_overlap = key
+        cached = self._chunk_cache.get(key)
+        if cached is not None:
+            self._chunk_cache.move_to_end(key)
+            paths = {'filename': doc['filename'], 'relative_path': file_path, 'full_path': doc['full_path']}
+            return [{**chunk, **paths} for chunk in cached[0]]
+        
+        # Use code-aware chunking for programming languages
+        if self._is_code_file(language):
+            file_chunks = self._chunk_code_intelligently(content, doc, chunk_size, chunk_overlap, digest)
+        else:
+            file_chunks = self._chunk_text_by_lines(content, doc, chunk_size, chunk_overlap)
+        
+        self._remember_chunks(key, file_chunks)
+        return file_chunks
+    
+    def _remember_chunks(self, key: Tuple, file_chunks: List[Dict]):
+        """Cache a document's chunks, evicting the least recently used until under CHUNK_CACHE_MAX_CHARS"""
+        size = sum(len(chunk['content']) for chunk in file_chunks)
+        if size > CHUNK_CACHE_MAX_CHARS or key in self._chunk_cache:
+            return
+        
+        self._chunk_cache[key] = (file_chunks, size)
+        self._chunk_cache_chars += size
+        while self._chunk_cache_chars > CHUNK_CACHE_MAX_CHARS:
+            _, (_, evicted_size) = self._chunk_cache.popitem(last=False)
+            self._chunk_cache_chars -= evicted_size
+    
+    @staticmethod
+    def _fit_overlap(length: int, chunk_size: int, chunk_overlap: int, r_max: float) -> int:
+        """Shrink the overlap to what a document's length needs, never exceeding the configured overlap"""
+        # n + 1 chunks tile the document when each of the n seams overlaps by `needed / n`;
+        # when that repetition would exceed r_max of a chunk, keep the configured overlap
+        n = max(1, length // chunk_size)
+        needed = (n + 1) * chunk_size - length
+        if length + math.ceil(n * r_max * chunk_size) >= (n + 1) * chunk_size:
+            return min(chunk_overlap, math.ceil(needed / n))
+        return chunk_overlap
     
     def _is_code_file(self, language: str) -> bool:
         """Check if this is a code file that benefits from intelligent chunking"""
@@ -638,41 +877,24 @@ class ChromaIndexer:
         }
         return language in code_languages
     
-    def _chunk_code_intelligently(self, content: str, doc: Dict, chunk_size: int, chunk_overlap: int) -> List[Dict]:
+    def _chunk_code_intelligently(self, content: str, doc: Dict, chunk_size: int, chunk_overlap: int,
+                                  digest: Optional[bytes] = None) -> List[Dict]:
         """Chunk code files by preserving semantic boundaries like functions, classes"""
         chunks = []
         lines = content.split('\n')
         file_path = doc.get('relative_path', doc['filename'])
         
-        # Define semantic boundaries for different languages
-        semantic_markers = {
-            'Python': [r'^\s*def\s+', r'^\s*class\s+', r'^\s*@\w+', r'^\s*if\s+__name__'],
-            'JavaScript': [r'^\s*function\s+', r'^\s*class\s+', r'^\s*const\s+\w+\s*=\s*\(', r'^\s*export\s+'],
-            'TypeScript': [r'^\s*function\s+', r'^\s*class\s+', r'^\s*interface\s+', r'^\s*type\s+'],
-            'Java': [r'^\s*public\s+class\s+', r'^\s*private\s+\w+', r'^\s*public\s+\w+', r'^\s*@\w+'],
-            'C++': [r'^\s*class\s+', r'^\s*struct\s+', r'^\s*\w+\s*::\s*', r'^\s*template\s*<'],
-            'C': [r'^\s*\w+\s+\w+\s*\(', r'^\s*struct\s+', r'^\s*typedef\s+', r'^\s*#define\s+']
-        }
+        boundaries = self._get_boundaries(content, lines, doc['language'], digest)
         
-        language = doc['language']
-        markers = semantic_markers.get(language, [])
-        
-        current_chunk_lines = []
+        current_chunk_lines = deque()
         current_size = 0
         chunk_index = 0
         
-        import re
-        
         for i, line in enumerate(lines):
             line_size = len(line) + 1  # +1 for newline
             
             # Check if this line is a semantic boundary
-            is_boundary = False
-            if markers:
-                for marker in markers:
-                    if re.match(marker, line):
-                        is_boundary = True
-                        break
+            is_boundary = i in boundaries
             
             # If we're at a boundary and have content, consider splitting
             if is_boundary and current_chunk_lines and current_size > chunk_size * 0.6:
@@ -681,8 +903,8 @@ class ChromaIndexer:
                 chunks.append(self._create_chunk(chunk_content, doc, chunk_index, content))
                 
                 # Start new chunk with overlap
-                overlap_lines = self._get_overlap_lines(current_chunk_lines, chunk_overlap)
-                current_chunk_lines = overlap_lines + [line]
+                current_chunk_lines = self._get_overlap_lines(current_chunk_lines, chunk_overlap)
+                current_chunk_lines.append(line)
                 current_size = sum(len(l) + 1 for l in current_chunk_lines)
                 chunk_index += 1
                 continue
@@ -694,8 +916,8 @@ class ChromaIndexer:
                 chunks.append(self._create_chunk(chunk_content, doc, chunk_index, content))
                 
                 # Start new chunk with overlap
-                overlap_lines = self._get_overlap_lines(current_chunk_lines, chunk_overlap)
-                current_chunk_lines = overlap_lines + [line]
+                current_chunk_lines = self._get_overlap_lines(current_chunk_lines, chunk_overlap)
+                current_chunk_lines.append(line)
                 current_size = sum(len(l) + 1 for l in current_chunk_lines)
                 chunk_index += 1
             else:
@@ -709,11 +931,44 @@ class ChromaIndexer:
         
         return chunks
     
+    def _get_boundary_pattern(self, language: str) -> Optional[re.Pattern]:
+        """Get the compiled semantic boundary pattern for a language, or None if it has no markers"""
+        if language not in self._marker_cache:
+            markers = SEMANTIC_MARKERS.get(language)
+            # RE2 matches in linear time when installed; every marker is RE2-compatible
+            self._marker_cache[language] = (
+                (re2 or re).compile('|'.join(f'(?:{marker})' for marker in markers)) if markers else None
+            )
+        return self._marker_cache[language]
+    
+    def _get_boundaries(self, content: str, lines: List[str], language: str,
+                        digest: Optional[bytes] = None) -> frozenset:
+        """Get the semantic boundary line numbers, reusing the result for content seen before"""
+        pattern = self._get_boundary_pattern(language)
+        if pattern is None:
+            return frozenset()
+        
+        # Callers that already hashed the content pass its digest to avoid hashing it again
+        if digest is None:
+            digest = hashlib.blake2b(content.encode('utf-8'), digest_size=16).digest()
+        key = (digest, language)
+        boundaries = self._boundary_cache.get(key)
+        if boundaries is not None:
+            self._boundary_cache.move_to_end(key)
+            return boundaries
+        
+        match = pattern.match
+        boundaries = frozenset(i for i, line in enumerate(lines) if match(line))
+        self._boundary_cache[key] = boundaries
+        if len(self._boundary_cache) > BOUNDARY_CACHE_SIZE:
+            self._boundary_cache.popitem(last=False)
+        return boundaries
+    
     def _chunk_text_by_lines(self, content: str, doc: Dict, chunk_size: int, chunk_overlap: int) -> List[Dict]:
         """Chunk non-code files by lines with proper overlap"""
         chunks = []
         lines = content.split('\n')
-        current_chunk_lines = []
+        current_chunk_lines = deque()
         current_chunk_size = 0
         chunk_index = 0
         
@@ -727,8 +982,8 @@ class ChromaIndexer:
                 chunks.append(self._create_chunk(chunk_content, doc, chunk_index, content))
                 
                 # Start new chunk with overlap
-                overlap_lines = self._get_overlap_lines(current_chunk_lines, chunk_overlap)
-                current_chunk_lines = overlap_lines + [line]
+                current_chunk_lines = self._get_overlap_lines(current_chunk_lines, chunk_overlap)
+                current_chunk_lines.append(line)
                 current_chunk_size = sum(len(l) + 1 for l in current_chunk_lines)
                 chunk_index += 1
             else:
@@ -742,27 +997,31 @@ class ChromaIndexer:
         
         return chunks
     
-    def _get_overlap_lines(self, lines: List[str], overlap_size: int) -> List[str]:
-        """Get smart overlap lines that preserve code context"""
+    def _get_overlap_lines(self, lines: deque, overlap_size: int) -> deque:
+        """Get smart overlap lines that preserve code context, as the start of the next chunk"""
+        overlap_lines = deque()
         if not lines or overlap_size <= 0:
-            return []
+            return overlap_lines
         
-        overlap_lines = []
         overlap_chars = 0
         
         # Work backwards, but try to include complete semantic units
-        for i in range(len(lines) - 1, -1, -1):
-            line = lines[i]
+        for line in reversed(lines):
             test_size = overlap_chars + len(line) + 1  # +1 for newline
             
             if test_size <= overlap_size:
-                overlap_lines.insert(0, line)
+                overlap_lines.appendleft(line)
                 overlap_chars = test_size
                 
                 # If we hit certain patterns, that's a good place to stop
                 if line.strip() and any(pattern in line for pattern in ['def ', 'class ', 'function ', '{']):
                     break
             else:
+                # A line too long to carry whole still overlaps by its tail, starting on a word boundary
+                if not overlap_lines:
+                    cut = line.find(' ', len(line) - overlap_size)
+                    if cut != -1 and line[cut + 1:].strip():
+                        overlap_lines.appendleft(line[cut + 1:])
                 break
         
         return overlap_lines
@@ -772,10 +1031,11 @@ class ChromaIndexer:
         file_path = doc.get('relative_path', doc['filename'])
         
         # Validate chunk size
-        if len(chunk_content) > config.chunk_size * 1.5:  # Allow 50% overflow
+        warn = logger.isEnabledFor(logging.WARNING)
+        if warn and len(chunk_content) > config.chunk_size * 1.5:  # Allow 50% overflow
             logger.warning(f"Chunk {chunk_index} in {file_path} exceeds size limit: {len(chunk_content)} chars")
         
-        if len(chunk_content.strip()) == 0:
+        if warn and len(chunk_content.strip()) == 0:
             logger.warning(f"Empty chunk {chunk_index} in {file_path}")
         
         # Find position in original content
@@ -814,9 +1074,11 @@ class ChromaIndexer:
         except Exception:
             return {}
 
-    def _has_file_changed(self, file_path: Path, existing_metadata: Dict) -> bool:
+    def _has_file_changed(self, file_path: Path, existing_metadata: Dict,
+                          current_metadata: Optional[Dict] = None) -> bool:
         """Check if file has changed using multiple methods"""
-        current_metadata = self._get_file_metadata(file_path)
+        if current_metadata is None:
+            current_metadata = self._get_file_metadata(file_path)
         
         # Quick checks first
         if current_metadata['size'] != existing_metadata.get('size', 0):
@@ -855,11 +1117,12 @@ class ChromaIndexer:
         
         return False
 
-    def _get_file_hash(self, file_path: Path) -> str:
+    def _get_file_hash(self, file_path: Path, stat: Optional[os.stat_result] = None) -> str:
         """Calculate SHA-256 hash of file content with caching"""
         # Simple caching based on file mtime to avoid recalculating unchanged files
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = file_path.stat()
             cache_key = f"{file_path}_{stat.st_mtime}_{stat.st_size}"
             
             # Use a simple in-memory cache (could be expanded to disk cache)
@@ -869,25 +1132,30 @@ class ChromaIndexer:
             if cache_key in self._hash_cache:
                 return self._hash_cache[cache_key]
             
-            hash_sha256 = hashlib.sha256()
             with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_sha256.update(chunk)
+                if stat.st_size < HASH_MMAP_THRESHOLD:
+                    file_hash = hashlib.sha256(f.read()).hexdigest()
+                else:
+                    # Hint sequential access so the kernel reads ahead aggressively
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        file_hash = hashlib.sha256(mm).hexdigest()
             
-            file_hash = hash_sha256.hexdigest()
             self._hash_cache[cache_key] = file_hash
             return file_hash
         except Exception:
             return ""
 
-    def _get_file_metadata(self, file_path: Path) -> Dict[str, Any]:
-        """Get file metadata for change detection"""
+    def _get_file_metadata(self, file_path: Path, stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Get file metadata for change detection, reusing a stat result when given"""
         try:
-            stat = file_path.stat()
+            if stat is None:
+                stat = file_path.stat()
             return {
                 'size': stat.st_size,
                 'mtime': stat.st_mtime,
-                'hash': self._get_file_hash(file_path)
+                'hash': self._get_file_hash(file_path, stat)
             }
         except Exception:
             return {'size': 0, 'mtime': 0, 'hash': ''}
@@ -6,10 +6,12 @@ Provides semantic search across repositories, files, and chunks.
 import os
 import chromadb
 from chromadb.config import Settings
+from chromadb.utils import embedding_functions
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Set
 from backend.logger import get_logger
 from backend.chroma_client import ChromaClient
+from backend import query_cache
 from backend.config import config
 
 logger = get_logger()
@@ -29,15 +31,38 @@ class ChromaSearch:
             self.files_collection = self.chroma_client.get_or_create_collection("files")
             self.chunks_collection = self.chroma_client.get_or_create_collection("chunks")
             
+            # Same default model the collections embed with, used to embed queries once up front
+            self.embedding_function = embedding_functions.DefaultEmbeddingFunction()
+            
         except Exception as e:
             logger.error(f"Error initializing ChromaSearch: {e}")
             raise
     
-    def search_repositories(self, query: str, limit: int = 10, min_score: Optional[float] = None) -> List[Dict]:
+    def embed(self, query: str, use_cache: bool = True) -> Any:
+        """Embed a query string, returning the raw vector (cached on disk across runs)"""
+        model_name = self.embedding_function.name()
+        if use_cache:
+            cached = query_cache.get(query, model_name)
+            if cached is not None:
+                return cached
+        
+        vec = self.embedding_function([query])[0]
+        if use_cache:
+            query_cache.put(query, vec, model_name)
+        return vec
+    
+    def _query_input(self, query: Optional[str], query_embedding: Optional[Any]) -> Dict[str, Any]:
+        """Build the query arguments, preferring a precomputed embedding over re-embedding the text"""
+        if query_embedding is not None:
+            return {'query_embeddings': [query_embedding]}
+        return {'query_texts': [query]}
+    
+    def search_repositories(self, query: Optional[str], limit: int = 10, min_score: Optional[float] = None,
+                            query_embedding: Optional[Any] = None) -> List[Dict]:
         """Search repositories by semantic similarity"""
         try:
             results = self.repos_collection.query(
-                query_texts=[query],
+                **self._query_input(query, query_embedding),
                 n_results=min(limit, self.repos_collection.count())
             )
             
@@ -46,7 +71,8 @@ class ChromaSearch:
             logger.error(f"Error searching repositories: {e}")
             return []
     
-    def search_files(self, query: str, repo_name: Optional[str] = None, limit: int = 10, min_score: Optional[float] = None) -> List[Dict]:
+    def search_files(self, query: Optional[str], repo_name: Optional[str] = None, limit: int = 10, min_score: Optional[float] = None,
+                     query_embedding: Optional[Any] = None) -> List[Dict]:
         """Search files, optionally filtered by repository"""
         try:
             where_clause = {}
@@ -58,7 +84,7 @@ class ChromaSearch:
                 return []
             
             results = self.files_collection.query(
-                query_texts=[query],
+                **self._query_input(query, query_embedding),
                 n_results=min(limit, collection_count),
                 where=where_clause if where_clause else None
             )
@@ -68,7 +94,8 @@ class ChromaSearch:
             logger.error(f"Error searching files: {e}")
             return []
     
-    def search_chunks(self, query: str, repo_name: Optional[str] = None, language: Optional[str] = None, limit: int = 10, min_score: Optional[float] = None) -> List[Dict]:
+    def search_chunks(self, query: Optional[str], repo_name: Optional[str] = None, language: Optional[str] = None, limit: int = 10, min_score: Optional[float] = None,
+                      query_embedding: Optional[Any] = None) -> List[Dict]:
         """Search chunks with optional filters"""
         try:
             where_clause = {"type": "chunk"}
@@ -78,7 +105,7 @@ class ChromaSearch:
                 where_clause["language"] = language
             
             results = self.chunks_collection.query(
-                query_texts=[query],
+                **self._query_input(query, query_embedding),
                 n_results=min(limit, self.chunks_collection.count()),
                 where=where_clause
             )
@@ -88,14 +115,19 @@ class ChromaSearch:
             logger.error(f"Error searching chunks: {e}")
             return []
     
-    def search_all(self, query: str, limit: int = 5, min_score: Optional[float] = None) -> Dict[str, List[Dict]]:
+    def search_all(self, query: Optional[str], limit: int = 5, min_score: Optional[float] = None,
+                   query_embedding: Optional[Any] = None) -> Dict[str, List[Dict]]:
         """Search across all collections"""
         return {
-            "repositories": self.search_repositories(query, limit, min_score),
-            "files": self.search_files(query, limit=limit, min_score=min_score),
-            "chunks": self.search_chunks(query, limit=limit, min_score=min_score)
+            "repositories": self.search_repositories(query, limit, min_score, query_embedding=query_embedding),
+            "files": self.search_files(query, limit=limit, min_score=min_score, query_embedding=query_embedding),
+            "chunks": self.search_chunks(query, limit=limit, min_score=min_score, query_embedding=query_embedding)
         }
     
+    def search_all_vec(self, query_embedding: Any, limit: int = 5, min_score: Optional[float] = None) -> Dict[str, List[Dict]]:
+        """Search across all collections with a precomputed query embedding"""
+        return self.search_all(None, limit, min_score, query_embedding=query_embedding)
+    
     def get_repo_info(self, repo_name: str) -> Optional[Dict]:
         """Get detailed information about a specific repository"""
         try:
@@ -118,9 +150,11 @@ class ChromaSearch:
     def get_repo_files(self, repo_name: str, limit: int = 50) -> List[Dict]:
         """Get all files for a specific repository"""
         try:
+            # Previews are stored in metadata at index time, so skip fetching documents
             results = self.files_collection.get(
                 where={"repo_name": repo_name},
-                limit=limit
+                limit=limit,
+                include=['metadatas']
             )
             
             return self.chroma_client.batch_format_files(results, preview_length=200)
@@ -176,6 +210,15 @@ class ChromaSearch:
             logger.error(f"Error getting repositories list: {e}")
             return []
     
+    def get_indexed_repo_names(self) -> Set[str]:
+        """Get the names of all indexed repositories with a single metadata-only query"""
+        try:
+            results = self.repos_collection.get(include=['metadatas'])
+            return {metadata['repo_name'] for metadata in results['metadatas'] if metadata.get('repo_name')}
+        except Exception as e:
+            logger.error(f"Error getting indexed repository names: {e}")
+            return set()
+    
     def _format_results(self, results: Any, result_type: str, min_score: Optional[float] = None) -> List[Dict]:
         """Format ChromaDB results and filter by minimum search score"""
         formatted = []
@@ -186,17 +229,21 @@ class ChromaSearch:
         # Get minimum search threshold from config or parameter
         min_search_score = min_score if min_score is not None else config.min_search
         
-        for i, doc in enumerate(results['documents'][0]):
-            metadata = results['metadatas'][0][i]
-            distance = results['distances'][0][i] if 'distances' in results else 0
-            similarity = 1 - distance  # Convert distance to similarity
-            
-            # Filter out results below minimum search score
-            if similarity < min_search_score:
-                continue
+        documents = results['documents'][0]
+        metadatas = results['metadatas'][0]
+        distances = results['distances'][0] if results.get('distances') else [0] * len(documents)
+        
+        # Convert distances to similarities in one pass and filter before formatting
+        similarities = [1 - distance for distance in distances]
+        kept = [i for i, similarity in enumerate(similarities) if similarity >= min_search_score]
+        
+        for i in kept:
+            metadata = ChromaClient.intern_metadata(metadatas[i])
+            distance = distances[i]
+            similarity = similarities[i]
             
             formatted_result = {
-                'content': doc,
+                'content': documents[i],
                 'metadata': metadata,
                 'distance': distance,
                 'similarity': similarity,
@@ -9,11 +9,36 @@ from pathlib import Path
 from typing import Dict, Any, List
 from backend.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional, fall back to the stdlib parser
+    orjson = None
+
 logger = get_logger()
 
 class Config:
+    # Commonly used values are snapshotted onto the instance at load time
+    __slots__ = (
+        'source_folder', 'index_folder', 'supported_extensions', 'chunk_size',
+        'chunk_overlap', 'batch_size', 'min_search', 'ignore_patterns',
+        'max_file_size',
+    )
+    
+    source_folder: str
+    index_folder: str
+    supported_extensions: List[str]
+    chunk_size: int
+    chunk_overlap: int
+    batch_size: int
+    min_search: float
+    ignore_patterns: List[str]
+    max_file_size: int
+    
     _instance = None
     _config: Dict[str, Any] = {}
+    _mtime: float = 0
+    _size: int = -1
     
     def __new__(cls):
         if cls._instance is None:
@@ -30,8 +55,14 @@ class Config:
             raise FileNotFoundError("config.json is mandatory and must exist")
             
         try:
-            with open(config_path, 'r') as f:
-                cls._config = json.load(f)
+            stat = config_path.stat()
+            if orjson is not None:
+                cls._config = orjson.loads(config_path.read_bytes())
+            else:
+                with open(config_path, 'r') as f:
+                    cls._config = json.load(f)
+            cls._mtime, cls._size = stat.st_mtime, stat.st_size
+            cls._snapshot()
             logger.info(f"Configuration loaded from {config_path}")
         except Exception as e:
             logger.error(f"Error loading config.json: {e}")
@@ -49,41 +80,21 @@ class Config:
     
     @classmethod
     def reload(cls) -> None:
-        """Reload configuration from file"""
+        """Reload configuration from file, skipping the parse if it has not changed"""
+        try:
+            stat = Path("config.json").stat()
+            if stat.st_mtime == cls._mtime and stat.st_size == cls._size:
+                return
+        except OSError:
+            # Let _load_config report the missing file
+            pass
         cls._load_config()
     
-    # Convenience properties for commonly used config values
-    @property
-    def source_folder(self) -> str:
-        return self.get("source_folder")
-    
-    @property
-    def index_folder(self) -> str:
-        return self.get("index_folder")
-    
-    @property
-    def supported_extensions(self) -> List[str]:
-        return self.get("supported_extensions")
-    
-    @property
-    def chunk_size(self) -> int:
-        return self.get("chunk_size")
-    
-    @property
-    def chunk_overlap(self) -> int:
-        return self.get("chunk_overlap")
-    
-    @property
-    def batch_size(self) -> int:
-        return self.get("batch_size")
-    
-    @property
-    def min_search(self) -> float:
-        return self.get("min_search")
-    
-    @property
-    def ignore_patterns(self) -> List[str]:
-        return self.get("ignore_patterns")
+    @classmethod
+    def _snapshot(cls) -> None:
+        """Copy commonly used config values onto the instance as plain attributes"""
+        for key in cls.__slots__:
+            setattr(cls._instance, key, cls._config.get(key))
 
 
 # Global config instance
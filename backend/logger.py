@@ -1,6 +1,6 @@
 import logging
 
-def get_logger(name="smartsearch"):
+def _configure(name):
     logger = logging.getLogger(name)
     if not logger.handlers:
         handler = logging.StreamHandler()
@@ -10,7 +10,16 @@ def get_logger(name="smartsearch"):
         logger.setLevel(logging.INFO)
     return logger
 
+# Configured once at import; get_logger() hands back this reference for the default name
+_LOGGER = _configure("smartsearch")
+
+def get_logger(name="smartsearch"):
+    if name == "smartsearch":
+        return _LOGGER
+    return _configure(name)
+
 def get_chroma_logger():
     # Configure logging to only show errors for ChromaDB
-    logger = logging.getLogger('chromadb').setLevel(logging.ERROR)
+    logger = logging.getLogger('chromadb')
+    logger.setLevel(logging.ERROR)
     return logger
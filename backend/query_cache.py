@@ -0,0 +1,58 @@
+"""
+Persistent query embedding cache for smart search.
+Stores query vectors in SQLite so repeated searches skip the embedding model across CLI runs.
+"""
+
+import os
+import time
+import sqlite3
+import hashlib
+import numpy as np
+from typing import Optional
+from backend.logger import get_logger
+from backend.config import config
+
+logger = get_logger()
+
+# Cached embeddings older than this are evicted when the cache is opened
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+
+_connection: Optional[sqlite3.Connection] = None
+
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database once per process, evicting stale entries"""
+    global _connection
+    if _connection is None:
+        os.makedirs(config.index_folder, exist_ok=True)
+        _connection = sqlite3.connect(os.path.join(config.index_folder, "query_cache.sqlite"))
+        _connection.execute("CREATE TABLE IF NOT EXISTS cache(k BLOB PRIMARY KEY, v BLOB, ts INT)")
+        _connection.execute("DELETE FROM cache WHERE ts < ?", (int(time.time()) - CACHE_MAX_AGE,))
+        _connection.commit()
+    return _connection
+
+def _key(query: str, model_name: str) -> bytes:
+    """Build the cache key from the model name and query text"""
+    return hashlib.sha256(f"{model_name}\0{query}".encode('utf-8')).digest()
+
+def get(query: str, model_name: str = "default") -> Optional[np.ndarray]:
+    """Get a cached embedding for a query, or None if it is not cached"""
+    try:
+        row = _get_connection().execute(
+            "SELECT v FROM cache WHERE k = ?", (_key(query, model_name),)
+        ).fetchone()
+        return np.frombuffer(row[0], dtype=np.float32) if row else None
+    except sqlite3.Error as e:
+        logger.warning(f"Query cache lookup failed: {e}")
+        return None
+
+def put(query: str, vec, model_name: str = "default") -> None:
+    """Store the embedding for a query"""
+    try:
+        conn = _get_connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache(k, v, ts) VALUES (?, ?, ?)",
+            (_key(query, model_name), np.asarray(vec, dtype=np.float32).tobytes(), int(time.time()))
+        )
+        conn.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"Query cache update failed: {e}")
@@ -0,0 +1,4 @@
+"""
+CLI subcommands, one module per command.
+Each module exposes its Click command as `cmd` and is imported on demand by cli.LazyGroup.
+"""
@@ -0,0 +1,63 @@
+"""
+CLI command for diagnosing the ChromaDB database.
+"""
+
+import click
+from pathlib import Path
+
+@click.command()
+def check_db():
+    """Check database status and diagnose issues"""
+    try:
+        from backend import check_database_lock
+        from backend.chroma_client import ChromaClient
+        from backend.config import config
+        import os
+        
+        db_path = Path(os.path.join(config.index_folder, "chroma_db"))
+        sqlite_file = db_path / "chroma.sqlite3"
+        
+        click.echo("🔍 Checking ChromaDB status...")
+        click.echo(f"📁 Database path: {db_path}")
+        
+        # A single stat of the database file; only check the directory when it is missing
+        try:
+            file_size = os.stat(sqlite_file).st_size
+        except FileNotFoundError:
+            if db_path.is_dir():
+                click.echo("✅ No database file found - ready for first-time setup")
+            else:
+                click.echo("❌ Database directory does not exist")
+            return
+        
+        # Check file size
+        click.echo(f"📊 Database file size: {file_size:,} bytes")
+        
+        # Check if locked
+        if check_database_lock(db_path):
+            click.echo("🔒 Database is currently LOCKED by another process")
+            click.echo("💡 Solutions:")
+            click.echo("   1. Close any other instances of this application")
+            click.echo("   2. Check Windows Task Manager for Python processes")
+            click.echo("   3. Wait a few moments and try again")
+        else:
+            click.echo("✅ Database is available and not locked")
+            
+            # Try to connect
+            try:
+                client = ChromaClient()
+                if client.client:
+                    collections_info = client.client.list_collections()
+                    click.echo(f"✅ Successfully connected to database")
+                    click.echo(f"📚 Collections found: {len(collections_info)}")
+                    for collection in collections_info:
+                        click.echo(f"   - {collection.name}")
+                else:
+                    click.echo("❌ Failed to initialize database client")
+            except Exception as e:
+                click.echo(f"❌ Failed to connect to database: {e}")
+                
+    except Exception as e:
+        click.echo(f"❌ Error checking database: {e}")
+
+cmd = check_db
@@ -0,0 +1,96 @@
+"""
+Shared helpers for CLI commands.
+"""
+
+import click
+import os
+import functools
+import itertools
+import multiprocessing
+from collections import deque
+from operator import itemgetter
+from typing import List, Dict, Tuple
+
+# Static output shared by several commands
+LEGEND = "Legend: + added, * modified, = unchanged, - removed, ! error"
+SUMMARY_FMT = "📊 Total documents: {}"
+RESULT_ICONS = {"repositories": "📁", "files": "📄", "chunks": "🔗"}
+
+def find_git_repos(root: str) -> Tuple[str, ...]:
+    """Find Git repositories directly under root, reusing the last scan while root is unchanged"""
+    return _scan_git_repos(os.path.abspath(root), os.stat(root).st_mtime_ns)
+
+@functools.lru_cache(maxsize=8)
+def _scan_git_repos(root: str, mtime_ns: int) -> Tuple[str, ...]:
+    """Scan root with os.scandir so directory checks come from the cached entry type"""
+    repos = []
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir() and not entry.name.startswith('.'):
+                if os.path.exists(os.path.join(entry.path, '.git')):
+                    repos.append(entry.path)
+    return tuple(repos)
+
+@functools.lru_cache(maxsize=None)
+def get_cli_logger():
+    """Get the application logger on first use instead of at import time"""
+    from backend.logger import get_logger
+    return get_logger()
+
+# Indexer used by repository loader workers, inherited through fork
+_loader_indexer = None
+
+def _load_repository(repo_dir):
+    """Read one repository's files, returning (repo_dir, raw_docs, error)"""
+    try:
+        return repo_dir, _loader_indexer.load_repository_files(str(repo_dir)), None
+    except Exception as e:
+        return repo_dir, None, str(e)
+
+def load_repositories(indexer, repo_dirs: List):
+    """
+    Yield (repo_dir, raw_docs, error) for each repository in order.
+    
+    File reading runs ahead in a forked process pool so the caller, the only
+    process writing to ChromaDB, can index one repository while the next ones load.
+    At most one repository per worker is read ahead, bounding memory to a few repositories.
+    Falls back to loading sequentially where fork is unavailable (e.g. Windows).
+    """
+    global _loader_indexer
+    _loader_indexer = indexer
+    
+    workers = max(1, (os.cpu_count() or 1) // 2)
+    if len(repo_dirs) < 2 or workers < 2 or 'fork' not in multiprocessing.get_all_start_methods():
+        for repo_dir in repo_dirs:
+            yield _load_repository(repo_dir)
+        return
+    
+    with multiprocessing.get_context('fork').Pool(processes=workers) as pool:
+        pending = deque()
+        remaining = iter(repo_dirs)
+        for repo_dir in itertools.islice(remaining, workers):
+            pending.append(pool.apply_async(_load_repository, (repo_dir,)))
+        while pending:
+            result = pending.popleft().get()
+            # Start the next read before handing this repository to the caller
+            for repo_dir in itertools.islice(remaining, 1):
+                pending.append(pool.apply_async(_load_repository, (repo_dir,)))
+            yield result
+
+def display_results(title: str, results: List[Dict], icon: str):
+    """Display search results"""
+    if not results:
+        click.echo(f"{icon} {title}: No results found")
+        return
+    
+    # Build the whole block and write it once instead of one write per line
+    lines = [f"{icon} {title}:"]
+    fields = itemgetter('display_name', 'summary', 'content')
+    for result in results:
+        display_name, summary, content = fields(result)
+        similarity = result.get('similarity', 0)
+        if len(content) > 100:
+            lines.append(f"  • {display_name} (similarity: {similarity:.2f})\n    {summary}\n    Preview: {content[:100]}...\n")
+        else:
+            lines.append(f"  • {display_name} (similarity: {similarity:.2f})\n    {summary}\n")
+    click.echo("\n".join(lines))
@@ -0,0 +1,47 @@
+"""
+CLI command for showing the current configuration.
+"""
+
+import click
+import os
+from cli_cmds.common import find_git_repos, get_cli_logger
+
+@click.command(name='config')
+def config_cmd():
+    """Show current configuration"""
+    try:
+        from backend.config import config
+        
+        config_dict = config.get_all()
+        
+        click.echo("⚙️  Current Configuration:")
+        click.echo(f"📁 Source folder: {config_dict.get('source_folder', 'Not set')}")
+        click.echo(f"📂 Index folder: {config_dict.get('index_folder', 'Not set')}")
+        click.echo(f"📄 Supported extensions: {len(config_dict.get('supported_extensions', []))} types")
+        click.echo(f"📝 Chunk size: {config_dict.get('chunk_size', 'Not set')}")
+        click.echo(f"🔄 Chunk overlap: {config_dict.get('chunk_overlap', 'Not set')}")
+        click.echo(f"📊 Min search score: {config_dict.get('min_search', 'Not set')}")
+        
+        # Show source folder contents if it exists
+        source_folder = config_dict.get('source_folder')
+        if source_folder and os.path.exists(source_folder):
+            git_repos = [os.path.basename(repo) for repo in find_git_repos(source_folder)]
+            click.echo(f"\n📊 Found {len(git_repos)} Git repositories in source folder")
+            
+            if git_repos and len(git_repos) <= 10:
+                click.echo("📋 Repository list:")
+                for repo in git_repos:
+                    click.echo(f"  • {repo}")
+            elif git_repos:
+                click.echo(f"📋 First 10 repositories:")
+                for repo in git_repos[:10]:
+                    click.echo(f"  • {repo}")
+                click.echo(f"  ... and {len(git_repos) - 10} more")
+        else:
+            click.echo(f"\n❌ Source folder not accessible: {source_folder}")
+        
+    except Exception as e:
+        click.echo(f"❌ Error reading configuration: {e}")
+        get_cli_logger().error(f"Config error: {e}")
+
+cmd = config_cmd
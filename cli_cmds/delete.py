@@ -0,0 +1,25 @@
+"""
+CLI command for deleting an indexed repository.
+"""
+
+import click
+from cli_cmds.common import get_cli_logger
+
+@click.command()
+@click.argument('repo_name')
+@click.confirmation_option(prompt='Are you sure you want to delete this repository?')
+def delete(repo_name):
+    """Delete a repository and all its data"""
+    try:
+        from backend.chroma_indexer import ChromaIndexer
+        
+        # Lazy initialization - only create indexer when needed
+        indexer = ChromaIndexer()
+        indexer.delete_repository(repo_name)
+        click.echo(f"✅ Repository '{repo_name}' deleted successfully!")
+    
+    except Exception as e:
+        click.echo(f"❌ Error deleting repository: {e}")
+        get_cli_logger().error(f"Delete error: {e}")
+
+cmd = delete
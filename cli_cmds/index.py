@@ -0,0 +1,35 @@
+"""
+CLI command for indexing a single repository.
+"""
+
+import click
+from pathlib import Path
+from cli_cmds.common import LEGEND, SUMMARY_FMT, get_cli_logger
+
+@click.command()
+@click.argument('repo_path', type=click.Path(exists=True))
+@click.option('--name', '-n', help='Repository name (defaults to folder name)')
+def index(repo_path, name):
+    """Index a single repository"""
+    try:
+        from backend.chroma_indexer import ChromaIndexer
+        
+        indexer = ChromaIndexer()
+        repo_name = name or Path(repo_path).name
+        
+        click.echo(f"🔍 {repo_name}")
+        click.echo(f"📁 {repo_path}")
+        click.echo(LEGEND)
+        
+        indexer.index_repository(repo_path, repo_name)
+        
+        # Show summary
+        info = indexer.get_collections_info()
+        click.echo(f"✅ Success!")
+        click.echo(SUMMARY_FMT.format(info.get('total_documents', 'unknown')))
+        
+    except Exception as e:
+        click.echo(f"❌ Error: {e}")
+        get_cli_logger().error(f"Indexing error: {e}")
+
+cmd = index
@@ -0,0 +1,95 @@
+"""
+CLI command for indexing every Git repository in a directory.
+"""
+
+import click
+import os
+from pathlib import Path
+from cli_cmds.common import LEGEND, SUMMARY_FMT, find_git_repos, get_cli_logger, load_repositories
+
+@click.command()
+@click.argument('repos_dir', type=click.Path(exists=True), required=False)
+@click.option('--max-repos', '-m', default=10, help='Maximum number of repositories to index')
+@click.option('--verbose', '-v', is_flag=True, help='Show full tracebacks for unexpected errors')
+def index_all(repos_dir, max_repos, verbose):
+    """Index all repositories in a directory (defaults to source_folder from config)"""
+    try:
+        from backend.chroma_indexer import ChromaIndexer
+        from backend.config import config
+        
+        # Use config source_folder if no repos_dir provided
+        if repos_dir is None:
+            repos_dir = config.source_folder
+            if not os.path.exists(repos_dir):
+                click.echo(f"❌ Source folder not found: {repos_dir}")
+                click.echo("💡 Please update the 'source_folder' in config.json or provide a REPOS_DIR argument")
+                return
+        
+        indexer = ChromaIndexer()
+        repos_path = Path(repos_dir)
+        
+        click.echo(f"🔍 Scanning for repositories in: {repos_path}")
+        
+        # Find all git repositories
+        git_repos = [Path(repo) for repo in find_git_repos(repos_dir)]
+        
+        if not git_repos:
+            click.echo("❌ No Git repositories found in the specified directory")
+            return
+        
+        # Limit number of repos
+        repos_to_index = git_repos[:max_repos]
+        
+        click.echo(f"🔍 Found {len(git_repos)} Git repositories")
+        click.echo(f"📦 Indexing {len(repos_to_index)} repositories...")
+        click.echo(LEGEND)
+        
+        loaded = load_repositories(indexer, repos_to_index)
+        for i, (repo_dir, raw_docs, load_error) in enumerate(loaded, 1):
+            click.echo(f"\n[{i}/{len(repos_to_index)}] {repo_dir.name}")
+            try:
+                if load_error:
+                    raise RuntimeError(load_error)
+                indexer.index_repository(str(repo_dir), repo_dir.name, raw_docs=raw_docs)
+                click.echo("✅ Success")
+            except Exception as e:
+                click.echo(f"❌ Error: {e}")
+                try:
+                    get_cli_logger().error(f"Error indexing {repo_dir.name}: {e}")
+                except:
+                    pass
+        
+        # Show final summary
+        info = indexer.get_collections_info()
+        click.echo(f"\n🎉 Indexing complete!")
+        click.echo(SUMMARY_FMT.format(info.get('total_documents', 'unknown')))
+        
+    except Exception as e:
+        error_msg = str(e)
+        
+        if "being used by another process" in error_msg or "WinError 32" in error_msg:
+            click.echo(f"❌ Database file is locked: {error_msg}")
+            click.echo("💡 This usually means another instance of the application is running.")
+            click.echo("🔧 Solution:")
+            click.echo("   1. Close any other instances of this application")
+            click.echo("   2. Check Windows Task Manager for any lingering Python processes")
+            click.echo("   3. Wait a few seconds and try again")
+            click.echo("   4. If the issue persists, restart your computer")
+        elif "no such column" in error_msg.lower() or "database" in error_msg.lower():
+            click.echo(f"❌ ChromaDB database issue detected: {error_msg}")
+            click.echo("💡 This usually indicates a corrupted or incompatible database.")
+            click.echo("🔧 The system will attempt to reset the database automatically.")
+            click.echo("   If the issue persists, try manually deleting the index/chroma_db folder.")
+        else:
+            click.echo(f"❌ Error during batch indexing: {e}")
+            if verbose:
+                import traceback
+                click.echo(f"Traceback: {traceback.format_exc()}")
+        
+        try:
+            get_cli_logger().error(f"Batch indexing error: {e}")
+        except:
+            # Fallback if logger is not available
+            pass
+
+cmd = index_all
@@ -0,0 +1,47 @@
+"""
+CLI command for showing details about an indexed repository.
+"""
+
+import click
+from cli_cmds.common import get_cli_logger
+
+@click.command()
+@click.argument('repo_name')
+def info(repo_name):
+    """Get detailed information about a repository"""
+    try:
+        from backend.chroma_search import ChromaSearch
+        
+        # Lazy initialization - only create searcher when needed
+        searcher = ChromaSearch()
+        repo_info = searcher.get_repo_info(repo_name)
+        
+        if repo_info:
+            click.echo(f"📁 Repository: {repo_info['name']}")
+            click.echo(f"🔤 Language: {repo_info['language']}")
+            click.echo(f"📊 Files: {repo_info['file_count']} supported / {repo_info['total_files']} total")
+            click.echo(f"📅 Indexed: {repo_info['indexed_at']}")
+            click.echo(f"📍 Path: {repo_info['path']}")
+            click.echo(f"📝 Description: {repo_info['description']}")
+            
+            # Show files
+            files = searcher.get_repo_files(repo_name, 10)
+            if files:
+                click.echo(f"\n📄 Sample files:")
+                for file in files[:5]:
+                    click.echo(f"  • {file['file_path']} ({file['language']})")
+        else:
+            click.echo(f"❌ Repository '{repo_name}' not found")
+            
+            # Suggest similar repositories
+            similar = searcher.search_repositories(repo_name, 3)
+            if similar:
+                click.echo(f"\n💡 Did you mean:")
+                for repo in similar:
+                    click.echo(f"  • {repo['metadata']['repo_name']}")
+    
+    except Exception as e:
+        click.echo(f"❌ Error getting repository info: {e}")
+        get_cli_logger().error(f"Info error: {e}")
+
+cmd = info
@@ -0,0 +1,39 @@
+"""
+CLI command for inspecting raw collection data.
+"""
+
+import click
+from cli_cmds.common import get_cli_logger
+
+@click.command()
+@click.argument('collection', type=click.Choice(['repositories', 'files', 'chunks']))
+@click.option('--limit', '-n', default=5, help='Number of items to show')
+def inspect(collection, limit):
+    """Inspect collection data for debugging"""
+    try:
+        from backend.chroma_search import ChromaSearch
+        
+        # Lazy initialization - only create searcher when needed
+        searcher = ChromaSearch()
+        data = searcher.inspect_collection(collection, limit)
+        
+        if 'error' in data:
+            click.echo(f"❌ Error: {data['error']}")
+            return
+        
+        click.echo(f"🔍 Collection: {collection}")
+        click.echo(f"📊 Total items: {data['total_count']}")
+        click.echo(f"📋 Sample size: {data['sample_size']}")
+        click.echo()
+        
+        for item in data['sample_data']:
+            click.echo(f"🆔 ID: {item['id']}")
+            click.echo(f"📝 Content: {item['document_preview']}")
+            click.echo(f"📊 Metadata: {item['metadata']}")
+            click.echo("-" * 50)
+    
+    except Exception as e:
+        click.echo(f"❌ Inspection error: {e}")
+        get_cli_logger().error(f"Inspection error: {e}")
+
+cmd = inspect
@@ -0,0 +1,71 @@
+"""
+CLI command for the interactive search mode.
+"""
+
+import click
+import time
+from functools import lru_cache
+from cli_cmds.common import RESULT_ICONS, display_results, get_cli_logger
+
+# Cached query embeddings are reused for at most this many seconds
+QUERY_CACHE_TTL = 600
+
+@click.command()
+def interactive():
+    """Interactive search mode for exploring your repositories"""
+    try:
+        from backend.chroma_search import ChromaSearch
+        
+        # Lazy initialization - only create searcher when needed
+        searcher = ChromaSearch()
+        
+        # Repeated queries skip the embedding model; the TTL bucket in the key expires old entries
+        @lru_cache(maxsize=256)
+        def _embed(query, ttl_bucket):
+            return searcher.embed(query)
+        
+        click.echo("🔍 Interactive Search Mode")
+        click.echo("Enter search queries to find repositories, files, and code! (type 'quit' to exit)")
+        click.echo("Examples:")
+        click.echo("  • 'authentication'")
+        click.echo("  • 'database connection'")
+        click.echo("  • 'Python machine learning'")
+        click.echo()
+        
+        while True:
+            try:
+                query = click.prompt("🔍 Search", type=str)
+                if query.lower() in ['quit', 'exit', 'bye']:
+                    click.echo("👋 Goodbye!")
+                    break
+                
+                # Perform search
+                click.echo(f"\n🔍 Searching for: '{query}'")
+                query_embedding = _embed(query, int(time.monotonic() // QUERY_CACHE_TTL))
+                all_results = searcher.search_all_vec(query_embedding, 3)
+                
+                found_any = False
+                for result_type, results in all_results.items():
+                    if results:
+                        found_any = True
+                        display_results(result_type.title(), results, RESULT_ICONS[result_type])
+                        click.echo()
+                
+                if not found_any:
+                    click.echo("❌ No results found. Try a different search term.")
+                    click.echo("💡 Use 'stats' command to see available repositories.")
+                
+                click.echo()
+                
+            except KeyboardInterrupt:
+                click.echo("\n👋 Goodbye!")
+                break
+            except EOFError:
+                click.echo("\n👋 Goodbye!")
+                break
+    
+    except Exception as e:
+        click.echo(f"❌ Interactive search error: {e}")
+        get_cli_logger().error(f"Interactive search error: {e}")
+
+cmd = interactive
@@ -0,0 +1,94 @@
+"""
+CLI command for reindexing the configured source folder.
+"""
+
+import click
+import os
+from pathlib import Path
+from cli_cmds.common import LEGEND, find_git_repos, get_cli_logger, load_repositories
+
+@click.command()
+@click.option('--max-repos', '-m', default=None, help='Maximum number of repositories to index (default: all)')
+@click.option('--force', '-f', is_flag=True, help='Force reindex of existing repositories')
+def reindex(max_repos, force):
+    """Reindex all repositories from the configured source folder"""
+    try:
+        from backend.chroma_indexer import ChromaIndexer
+        from backend.chroma_search import ChromaSearch
+        from backend.config import config
+        
+        source_folder = config.source_folder
+        
+        if not os.path.exists(source_folder):
+            click.echo(f"❌ Source folder not found: {source_folder}")
+            click.echo("💡 Please update the 'source_folder' in config.json")
+            return
+        
+        indexer = ChromaIndexer()
+        
+        click.echo(f"🔍 Scanning for repositories in: {source_folder}")
+        
+        # Find all git repositories
+        git_repos = [Path(repo) for repo in find_git_repos(source_folder)]
+        
+        if not git_repos:
+            click.echo("❌ No Git repositories found in the configured source folder")
+            click.echo(f"💡 Checked directory: {source_folder}")
+            return
+        
+        # Apply max_repos limit if specified
+        if max_repos:
+            max_repos = int(max_repos)
+            repos_to_index = git_repos[:max_repos]
+            click.echo(f"🔍 Found {len(git_repos)} Git repositories, indexing first {len(repos_to_index)}")
+        else:
+            repos_to_index = git_repos
+            click.echo(f"🔍 Found {len(git_repos)} Git repositories, indexing all")
+        
+        click.echo(f"📁 Source folder: {source_folder}")
+        click.echo(f"📦 Repositories to index: {len(repos_to_index)}")
+        click.echo(LEGEND)
+        click.echo()
+        
+        successful = 0
+        failed = 0
+        
+        # Look up already indexed repositories once instead of per repository
+        indexed = set() if force else ChromaSearch().get_indexed_repo_names()
+        
+        # Read the repositories that need indexing ahead of time, in order
+        loaded = load_repositories(indexer, [repo for repo in repos_to_index if repo.name not in indexed])
+        
+        for i, repo_dir in enumerate(repos_to_index, 1):
+            click.echo(f"[{i}/{len(repos_to_index)}] {repo_dir.name}")
+            try:
+                # Check if already indexed (unless force flag is used)
+                if repo_dir.name in indexed:
+                    click.echo(f"⏭️  Already indexed (use --force to reindex)")
+                    successful += 1
+                    continue
+                
+                _, raw_docs, load_error = next(loaded)
+                if load_error:
+                    raise RuntimeError(load_error)
+                indexer.index_repository(str(repo_dir), repo_dir.name, raw_docs=raw_docs)
+                click.echo("✅ Success")
+                successful += 1
+                
+            except Exception as e:
+                click.echo(f"❌ Error: {e}")
+                get_cli_logger().error(f"Error indexing {repo_dir.name}: {e}")
+                failed += 1
+        
+        # Show final summary
+        info = indexer.get_collections_info()
+        click.echo(f"\n🎉 Reindexing complete!")
+        click.echo(f"✅ Successful: {successful}")
+        click.echo(f"❌ Failed: {failed}")
+        click.echo(f"📊 Total documents in database: {info.get('total_documents', 'unknown')}")
+        
+    except Exception as e:
+        click.echo(f"❌ Error during reindexing: {e}")
+        get_cli_logger().error(f"Reindexing error: {e}")
+
+cmd = reindex
@@ -0,0 +1,33 @@
+"""
+CLI command for resetting the ChromaDB database.
+"""
+
+import click
+import os
+from pathlib import Path
+
+@click.command()
+def reset_db():
+    """Reset the ChromaDB database (WARNING: This will delete all data!)"""
+    try:
+        from backend.config import config
+        import shutil
+        
+        db_path = Path(os.path.join(config.index_folder, "chroma_db"))
+        
+        if not click.confirm(f"⚠️  This will permanently delete all indexed data in {db_path}. Continue?"):
+            click.echo("❌ Operation cancelled")
+            return
+            
+        if db_path.exists():
+            shutil.rmtree(db_path)
+            click.echo(f"✅ Database directory deleted: {db_path}")
+        else:
+            click.echo(f"ℹ️  Database directory does not exist: {db_path}")
+            
+        click.echo("✅ Database reset complete. You can now run indexing commands.")
+        
+    except Exception as e:
+        click.echo(f"❌ Error resetting database: {e}")
+
+cmd = reset_db
@@ -0,0 +1,60 @@
+"""
+CLI command for searching indexed repositories, files and chunks.
+"""
+
+import click
+from cli_cmds.common import RESULT_ICONS, display_results, get_cli_logger
+
+@click.command()
+@click.argument('query')
+@click.option('--type', '-t', type=click.Choice(['repos', 'files', 'chunks', 'all']), default='all', help='Search type')
+@click.option('--repo', '-r', help='Filter by repository name')
+@click.option('--lang', '-l', help='Filter by programming language')
+@click.option('--limit', '-n', default=5, help='Number of results per type')
+@click.option('--min-score', '-s', type=float, help='Minimum similarity score (overrides config default)')
+@click.option('--no-cache', is_flag=True, help='Do not read or write the query embedding cache')
+def search(query, type, repo, lang, limit, min_score, no_cache):
+    """Search indexed repositories and files"""
+    try:
+        from backend.chroma_search import ChromaSearch
+        
+        # Lazy initialization - only create searcher when needed
+        searcher = ChromaSearch()
+        
+        click.echo(f"🔍 Searching for: '{query}'")
+        if repo:
+            click.echo(f"📁 Repository filter: {repo}")
+        if lang:
+            click.echo(f"🔤 Language filter: {lang}")
+        if min_score is not None:
+            click.echo(f"📊 Minimum score: {min_score}")
+        click.echo()
+        
+        # Embed the query once and reuse it for every collection searched
+        query_embedding = searcher.embed(query, use_cache=not no_cache)
+        
+        if type == 'repos':
+            results = searcher.search_repositories(query, limit, min_score, query_embedding=query_embedding)
+            display_results("Repositories", results, "📁")
+        
+        elif type == 'files':
+            results = searcher.search_files(query, repo, limit, min_score, query_embedding=query_embedding)
+            display_results("Files", results, "📄")
+        
+        elif type == 'chunks':
+            results = searcher.search_chunks(query, repo, lang, limit, min_score, query_embedding=query_embedding)
+            display_results("Code Chunks", results, "🔗")
+        
+        else:  # all
+            all_results = searcher.search_all(query, limit, min_score, query_embedding=query_embedding)
+            
+            for result_type, results in all_results.items():
+                if results:
+                    display_results(result_type.title(), results, RESULT_ICONS[result_type])
+                    click.echo()
+        
+    except Exception as e:
+        click.echo(f"❌ Search error: {e}")
+        get_cli_logger().error(f"Search error: {e}")
+
+cmd = search
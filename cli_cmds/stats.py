@@ -0,0 +1,42 @@
+"""
+CLI command for showing database statistics.
+"""
+
+import click
+from cli_cmds.common import get_cli_logger
+
+@click.command()
+def stats():
+    """Show database statistics"""
+    try:
+        from backend.chroma_search import ChromaSearch
+        
+        # Lazy initialization - only create searcher when needed
+        searcher = ChromaSearch()
+        stats = searcher.get_collection_stats()
+        
+        click.echo("📊 Database Statistics:")
+        click.echo(f"  📁 Repositories: {stats.get('repositories', 0)}")
+        click.echo(f"  📄 Files: {stats.get('files', 0)}")
+        click.echo(f"  🔗 Chunks: {stats.get('chunks', 0)}")
+        click.echo(f"  🔤 Languages: {stats.get('languages', 0)}")
+        
+        # Show repositories
+        repos = stats.get('repo_names', [])
+        if repos:
+            click.echo(f"\n📁 Indexed repositories:")
+            for repo in repos:
+                click.echo(f"  • {repo}")
+        
+        # Show languages
+        languages = searcher.get_languages()
+        if languages:
+            click.echo(f"\n🔤 Available languages:")
+            for lang in languages:
+                click.echo(f"  • {lang}")
+    
+    except Exception as e:
+        click.echo(f"❌ Error getting statistics: {e}")
+        get_cli_logger().error(f"Stats error: {e}")
+
+cmd = stats
@@ -8,39 +8,31 @@ import sys
 import tempfile
 import shutil
 import time
+import gc
 from pathlib import Path
 
+from chromadb.api.shared_system_client import SharedSystemClient
+
 # Add parent directory to path so we can import backend modules
 sys.path.append(str(Path(__file__).parent.parent))
 
 from backend.chroma_indexer import ChromaIndexer
 from backend.chroma_search import ChromaSearch
+from backend.chroma_client import ChromaClient
 from backend.logger import get_logger
 from backend.config import config
 
 logger = get_logger()
 
-def test_chroma_integration():
-    """Test ChromaDB integration with sample data"""
-    
-    # Create temporary directory for testing
-    with tempfile.TemporaryDirectory() as temp_dir:
-        try:
-            temp_path = Path(temp_dir)
-            
-            # Create sample repository structure
-            repo_path = temp_path / "test_repo"
-            repo_path.mkdir()
-            
-            # Create sample files
-            (repo_path / "README.md").write_text("""
+# Sample repository contents written by the integration test
+_README = b"""
 # Test Project
 
 This is a test project for ChromaDB integration.
 It demonstrates semantic search capabilities.
-""")
-            
-            (repo_path / "main.py").write_text("""
+"""
+
+_MAIN_PY = b"""
 def authenticate_user(username, password):
     \"\"\"Authenticate user with username and password\"\"\"
     if not username or not password:
@@ -65,9 +57,9 @@ class UserManager:
             'created_at': 'now'
         }
         return True
-""")
-            
-            (repo_path / "utils.js").write_text("""
+"""
+
+_UTILS_JS = b"""
 function calculateTotal(items) {
     /* Calculate total price of items */
     return items.reduce((sum, item) => sum + item.price, 0);
@@ -83,7 +75,40 @@ async function fetchUserData(userId) {
         return null;
     }
 }
-""")
+"""
+
+def _remove_tree(path: Path):
+    """Remove a directory, retrying with backoff while Windows still holds file locks"""
+    for delay in (0, 0.01, 0.04, 0.16):
+        time.sleep(delay)
+        try:
+            shutil.rmtree(path)
+            return
+        except FileNotFoundError:
+            return
+        except PermissionError:
+            continue
+    shutil.rmtree(path, ignore_errors=True)
+
+def test_chroma_integration():
+    """Test ChromaDB integration with sample data"""
+    
+    # Create temporary directory for testing
+    temp_dir = tempfile.mkdtemp()
+    try:
+        try:
+            temp_path = Path(temp_dir)
+            
+            # Create sample repository structure
+            repo_path = temp_path / "test_repo"
+            repo_path.mkdir()
+            
+            # Create sample files
+            (repo_path / "README.md").write_bytes(_README)
+            
+            (repo_path / "main.py").write_bytes(_MAIN_PY)
+            
+            (repo_path / "utils.js").write_bytes(_UTILS_JS)
             
             # Test ChromaDB indexing
             print("🔍 Testing ChromaDB Indexing...")
@@ -135,11 +160,12 @@ async function fetchUserData(userId) {
                 print(f"  Files: {stats['files']}")
                 print(f"  Chunks: {stats['chunks']}")
                 
-                # Cleanup searcher properly
+                # Drop every reference to the client, then evict it from chromadb's system cache,
+                # which otherwise keeps the database files open after ChromaClient.close()
                 del searcher
-                
-                # Add small delay to ensure file handles are closed
-                time.sleep(0.5)
+                ChromaClient.close()
+                SharedSystemClient.clear_system_cache()
+                gc.collect()
                 
             except Exception as e:
                 print(f"❌ Search failed: {e}")
@@ -156,6 +182,8 @@ async function fetchUserData(userId) {
                 return True
             else:
                 raise e
+    finally:
+        _remove_tree(Path(temp_dir))
 
 if __name__ == "__main__":
     try:
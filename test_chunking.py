@@ -1,3 +1,4 @@
+import sys
 from backend.chroma_indexer import ChromaIndexer
 
 def test_chunking():
@@ -65,22 +66,21 @@ It should be included in the appropriate chunk.''',
     }
     
     print("=== PYTHON FILE CHUNKING ===")
-    python_chunks = indexer._chunk_documents([python_doc], config_dict)
-    print(f'Generated {len(python_chunks)} chunks from Python file:')
+    python_chunks = list(indexer._chunk_documents([python_doc], config_dict))
+    out = [f'Generated {len(python_chunks)} chunks from Python file:']
     for i, chunk in enumerate(python_chunks):
-        print(f'\nChunk {i}:')
-        print(f'Size: {len(chunk["content"])} characters')
-        print(f'Chunk type: {chunk["chunk_type"]}')
-        print(f'Language: {chunk["language"]}')
-        print(f'Content:\n{chunk["content"][:200]}...')
+        out.append(f'\nChunk {i}:\nSize: {len(chunk["content"])} characters\n'
+                   f'Chunk type: {chunk["chunk_type"]}\nLanguage: {chunk["language"]}\n'
+                   f'Content:\n{chunk["content"][:200]}...')
+    sys.stdout.write('\n'.join(out) + '\n')
     
     print("\n\n=== TEXT FILE CHUNKING ===")
-    text_chunks = indexer._chunk_documents([text_doc], config_dict)
-    print(f'Generated {len(text_chunks)} chunks from text file:')
+    text_chunks = list(indexer._chunk_documents([text_doc], config_dict))
+    out = [f'Generated {len(text_chunks)} chunks from text file:']
     for i, chunk in enumerate(text_chunks):
-        print(f'\nChunk {i}:')
-        print(f'Size: {len(chunk["content"])} characters')
-        print(f'Content:\n{chunk["content"][:200]}...')
+        out.append(f'\nChunk {i}:\nSize: {len(chunk["content"])} characters\n'
+                   f'Content:\n{chunk["content"][:200]}...')
+    sys.stdout.write('\n'.join(out) + '\n')
     
     print("\n\n=== SMALL FILE TEST ===")
     small_doc = {
@@ -91,10 +91,26 @@ It should be included in the appropriate chunk.''',
         'language': 'Text'
     }
     
-    small_chunks = indexer._chunk_documents([small_doc], config_dict)
-    print(f'Small file generated {len(small_chunks)} chunks (should be 1):')
+    small_chunks = list(indexer._chunk_documents([small_doc], config_dict))
+    out = [f'Small file generated {len(small_chunks)} chunks (should be 1):']
     for i, chunk in enumerate(small_chunks):
-        print(f'Chunk {i}: {chunk["content"]}')
+        out.append(f'Chunk {i}: {chunk["content"]}')
+    sys.stdout.write('\n'.join(out) + '\n')
+    
+    print("\n\n=== FITTED OVERLAP TEST ===")
+    overlap_doc = {
+        'content': '\n'.join(f'Line {i} of the overlap test document.' for i in range(36)),
+        'filename': 'overlap.txt',
+        'relative_path': 'overlap.txt',
+        'full_path': '/path/to/overlap.txt',
+        'language': 'Text'
+    }
+    
+    # r_max 0 never fits the overlap, so it keeps the configured chunk_overlap
+    fixed_chunks = list(indexer._chunk_documents([overlap_doc], {**config_dict, 'r_max': 0}))
+    fitted_chunks = list(indexer._chunk_documents([overlap_doc], config_dict))
+    print(f'Configured overlap: {len(fixed_chunks)} chunks, fitted overlap: {len(fitted_chunks)} chunks (should be fewer)')
+    assert len(fitted_chunks) < len(fixed_chunks)
 
 if __name__ == "__main__":
     test_chunking()
@@ -4,39 +4,97 @@ This module provides functionality for user registration, login, and session man
 Updated for testing change detection.
 """
 
+import os
+import time
 import hashlib
-import uuid
+import hmac
+from collections import OrderedDict
+from secrets import token_hex
 from datetime import datetime, timedelta
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
+
+# Recent successful logins, keyed by (stored hash, HMAC of the attempt), so repeats skip the KDF.
+# Keys are HMACs under a random per-process key, so a leaked entry is worthless without this
+# process's memory; the cache still trades KDF protection for speed on recently used passwords.
+VERIFIED_CACHE_SIZE = 1024
+_verified_logins: "OrderedDict[Tuple[bytes, bytes], None]" = OrderedDict()
+_VERIFIED_KEY = os.urandom(32)
+
+# Sessions kept per manager; creating one more drops the least recently used
+MAX_SESSIONS = 10_000
+
+_EPOCH = datetime(1970, 1, 1)
+
+def _utc_from_ns(timestamp_ns: int) -> datetime:
+    """Convert a time.time_ns() timestamp to a naive UTC datetime."""
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
 
 class User:
     """Represents a user in the system."""
     
+    __slots__ = ('id', 'username', 'email', 'salt', 'password_hash', 'created_at_ns', 'last_login_ns', 'is_active',
+                 '_created_iso', '_last_login_iso')
+    
     def __init__(self, username: str, email: str, password: str):
-        self.id = str(uuid.uuid4())
+        self.id = token_hex(16)
         self.username = username
         self.email = email
+        self.salt = os.urandom(16)
         self.password_hash = self._hash_password(password)
-        self.created_at = datetime.utcnow()
-        self.last_login = None
+        self.created_at_ns = time.time_ns()
+        self.last_login_ns = 0  # 0 until the first login
         self.is_active = True
+        
+        # isoformat strings for to_dict, filled on first use
+        self._created_iso: Optional[str] = None
+        self._last_login_iso: Optional[str] = None
+    
+    @property
+    def created_at(self) -> datetime:
+        """Get the creation time as a UTC datetime."""
+        return _utc_from_ns(self.created_at_ns)
     
-    def _hash_password(self, password: str) -> str:
-        """Hash a password using SHA-256."""
-        return hashlib.sha256(password.encode()).hexdigest()
+    @property
+    def last_login(self) -> Optional[datetime]:
+        """Get the last login time as a UTC datetime, or None if the user never logged in."""
+        return _utc_from_ns(self.last_login_ns) if self.last_login_ns else None
+    
+    def _hash_password(self, password: str) -> bytes:
+        """Hash a password with scrypt and the user's salt."""
+        return hashlib.scrypt(password.encode('utf-8'), salt=self.salt, n=2**14, r=8, p=1, dklen=32)
     
     def check_password(self, password: str) -> bool:
         """Check if the provided password matches the stored hash."""
-        return self.password_hash == self._hash_password(password)
+        key = (self.password_hash, hmac.new(_VERIFIED_KEY, password.encode('utf-8'), hashlib.sha256).digest())
+        if key in _verified_logins:
+            _verified_logins.move_to_end(key)
+            return True
+        
+        if not hmac.compare_digest(self.password_hash, self._hash_password(password)):
+            return False
+        
+        _verified_logins[key] = None
+        if len(_verified_logins) > VERIFIED_CACHE_SIZE:
+            _verified_logins.popitem(last=False)
+        return True
+    
+    def record_login(self) -> None:
+        """Record a successful login at the current time."""
+        self.last_login_ns = time.time_ns()
+        self._last_login_iso = None
     
     def to_dict(self) -> Dict:
         """Convert user to dictionary representation."""
+        if self._created_iso is None:
+            self._created_iso = self.created_at.isoformat()
+        if self._last_login_iso is None and self.last_login_ns:
+            self._last_login_iso = self.last_login.isoformat()
         return {
             'id': self.id,
             'username': self.username,
             'email': self.email,
-            'created_at': self.created_at.isoformat(),
-            'last_login': self.last_login.isoformat() if self.last_login else None,
+            'created_at': self._created_iso,
+            'last_login': self._last_login_iso,
             'is_active': self.is_active
         }
 
@@ -45,7 +103,10 @@ class UserManager:
     
     def __init__(self):
         self.users: Dict[str, User] = {}
-        self.sessions: Dict[str, str] = {}  # session_id -> user_id
+        self.sessions: "OrderedDict[str, str]" = OrderedDict()  # session_id -> user_id, least recently used first
+        self.max_sessions = MAX_SESSIONS
+        self._by_username: Dict[str, str] = {}  # username -> user_id
+        self._by_email: Dict[str, str] = {}  # email -> user_id
     
     def register_user(self, username: str, email: str, password: str) -> Optional[User]:
         """Register a new user."""
@@ -54,33 +115,36 @@ class UserManager:
         
         user = User(username, email, password)
         self.users[user.id] = user
+        self._by_username[username] = user.id
+        self._by_email[email] = user.id
         return user
     
     def _user_exists(self, username: str, email: str) -> bool:
         """Check if a user with the given username or email already exists."""
-        for user in self.users.values():
-            if user.username == username or user.email == email:
-                return True
-        return False
+        return username in self._by_username or email in self._by_email
     
     def authenticate_user(self, username: str, password: str) -> Optional[User]:
         """Authenticate a user by username and password."""
-        for user in self.users.values():
-            if user.username == username and user.check_password(password):
-                user.last_login = datetime.utcnow()
-                return user
+        user_id = self._by_username.get(username)
+        user = self.users.get(user_id) if user_id else None
+        if user and user.check_password(password):
+            user.record_login()
+            return user
         return None
     
     def create_session(self, user: User) -> str:
         """Create a new session for the user."""
-        session_id = str(uuid.uuid4())
+        session_id = token_hex(16)
         self.sessions[session_id] = user.id
+        if len(self.sessions) > self.max_sessions:
+            self.sessions.popitem(last=False)
         return session_id
     
     def get_user_by_session(self, session_id: str) -> Optional[User]:
         """Get user by session ID."""
         user_id = self.sessions.get(session_id)
         if user_id:
+            self.sessions.move_to_end(session_id)
             return self.users.get(user_id)
         return None
     
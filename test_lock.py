@@ -1,35 +1,86 @@
 #!/usr/bin/env python3
 """
 Test script to simulate database locking by holding the connection open.
+
+In CI, hold the lock with --ci, probe it, then release it with --signal:
+    python test_lock.py --ci &
+    python cli.py check-db
+    python test_lock.py --signal
 """
 
 import time
 import sys
 import os
+import socket
+import tempfile
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from backend.chroma_client import ChromaClient
+from backend.chroma_client import get_client
 from backend.logger import get_logger
 
 logger = get_logger()
 
-def main():
+# How long the connection is held, and where --ci waits for the other process to report it is done
+HOLD_SECONDS = 30
+READY_SOCKET = os.path.join(tempfile.gettempdir(), "code_chroma_lock_ready")
+
+def wait_for_release_signal(timeout: float) -> bool:
+    """Block until another process connects to READY_SOCKET, or until timeout"""
+    if os.path.exists(READY_SOCKET):
+        os.unlink(READY_SOCKET)
+    
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(READY_SOCKET)
+        server.listen(1)
+        server.settimeout(timeout)
+        conn, _ = server.accept()
+        conn.close()
+        return True
+    except socket.timeout:
+        return False
+    finally:
+        server.close()
+        if os.path.exists(READY_SOCKET):
+            os.unlink(READY_SOCKET)
+
+def send_release_signal(timeout: float) -> bool:
+    """Tell a --ci run holding the lock that probing is done, waiting for it to start listening"""
+    deadline = time.monotonic() + timeout
+    while True:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            client.connect(READY_SOCKET)
+            return True
+        except (FileNotFoundError, ConnectionRefusedError):
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.05)
+        finally:
+            client.close()
+
+def main(ci: bool = False):
     print("🔒 Testing database locking...")
     
     try:
         # Create a client that will hold the database connection
-        client = ChromaClient()
+        client = get_client()
         print("✅ Database connection established")
         
         # Create a collection to ensure the database is actively used
         collection = client.get_or_create_collection("test_lock")
         print("✅ Test collection created")
         
-        print("🔄 Holding database connection for 30 seconds...")
-        print("   Try running 'python cli.py index-all --max-repos 1' in another terminal")
-        print("   You should see the file locking error message")
-        
-        time.sleep(30)
+        if ci and hasattr(socket, "AF_UNIX"):
+            print(f"🔄 Holding database connection until 'python test_lock.py --signal' runs (max {HOLD_SECONDS}s)...")
+            if not wait_for_release_signal(HOLD_SECONDS):
+                print("⏱️  No release signal received")
+        else:
+            print(f"🔄 Holding database connection for {HOLD_SECONDS} seconds...")
+            print("   Try running 'python cli.py index-all --max-repos 1' in another terminal")
+            print("   You should see the file locking error message")
+            
+            time.sleep(HOLD_SECONDS)
         
         print("✅ Test completed - releasing database connection")
         
@@ -40,4 +91,11 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
+    # --ci releases the connection as soon as --signal runs instead of sleeping
+    if "--signal" in sys.argv[1:]:
+        if not send_release_signal(HOLD_SECONDS):
+            print(f"❌ No test_lock.py --ci run is listening on {READY_SOCKET}")
+            sys.exit(1)
+        print("✅ Release signal sent")
+        sys.exit(0)
+    sys.exit(main(ci="--ci" in sys.argv[1:]))